@@ -1,6 +1,6 @@
 # Test_S&G_SOS_game.py
 import unittest
-from game_logic import SimpleSOSGame, GeneralSOSGame
+from game_logic import BaseSOSGame, SimpleSOSGame, GeneralSOSGame, Player
 
 class TestSOSGame(unittest.TestCase):
 
@@ -8,12 +8,25 @@ class TestSOSGame(unittest.TestCase):
         self.simple_game = SimpleSOSGame(board_size=3)
         self.general_game = GeneralSOSGame(board_size=3)
 
+    def test_base_post_move_result_is_neutral(self):
+        self.assertEqual(BaseSOSGame().post_move_result(),
+                         {"over": False, "message": None, "score_text": ""})
+
     # ----------------- Simple Mode Tests -----------------
     def test_simple_place_move(self):
         self.assertTrue(self.simple_game.make_move(0, 0, "S"))
         self.assertEqual(self.simple_game.get_cell(0, 0), "S")
         # Turn toggles after move
         self.assertEqual(self.simple_game.current_turn, "red")
+        self.assertEqual(self.simple_game.turn, Player.RED)
+        self.assertEqual(self.simple_game.get_cell_owner(0, 0), "blue")
+        self.assertEqual(self.simple_game.get_cell_owner_code(0, 0), Player.BLUE)
+        self.assertEqual(self.simple_game.packed_cells()[0], 1 | (1 << 2))
+
+    def test_simple_untrusted_letter(self):
+        self.assertFalse(self.simple_game.make_move(0, 0, "s"))
+        self.assertTrue(self.simple_game.make_move_untrusted(0, 0, " s "))
+        self.assertEqual(self.simple_game.get_cell(0, 0), "S")
 
     def test_simple_sos_winner(self):
         # Blue forms SOS
@@ -26,6 +39,18 @@ class TestSOSGame(unittest.TestCase):
         self.assertTrue(self.simple_game.game_over)
         self.assertEqual(self.simple_game.winner, "blue")
         self.assertEqual(self.simple_game.get_cell(0, 2), "S")
+        result = self.simple_game.post_move_result()
+        self.assertTrue(result["over"])
+        self.assertEqual(result["message"], "Blue wins by forming SOS!")
+
+    def test_encode_decode_state(self):
+        game = self.simple_game
+        self.assertEqual(game.encode_state(), 0)
+        game.make_move(0, 0, "S")  # Blue
+        game.make_move(2, 2, "O")  # Red
+        state = game.encode_state()
+        self.assertEqual(state, 1 + 2 * 3**8)
+        self.assertEqual(game.decode_state(state), game.letters)
 
     # ----------------- General Mode Tests -----------------
     def test_general_place_move_and_score(self):
@@ -42,6 +67,41 @@ class TestSOSGame(unittest.TestCase):
         # Turn toggles even after SOS
         self.assertEqual(game.current_turn, "red")
         self.assertEqual(game.scores["blue"], 1)
+        self.assertEqual(game.count_all_sos(), 1)
+        result = game.post_move_result()
+        self.assertFalse(result["over"])
+        self.assertEqual(result["score_text"], "Blue: 1 | Red: 0")
+
+    def test_general_sos_completed_in_middle(self):
+        game = GeneralSOSGame(board_size=4)
+        game.make_move(0, 0, "S")  # Blue
+        game.make_move(2, 2, "S")  # Red
+        game.make_move(0, 2, "S")  # Blue
+        game.make_move(2, 0, "S")  # Red
+        game.make_move(1, 1, "O")  # Blue completes two SOS with the middle O
+        self.assertEqual(game.scores["blue"], 2)
+        self.assertEqual(sorted(game.last_sos_lines), [(0, 0, 2, 2), (0, 2, 2, 0)])
+
+    def place_letters(self, game, cells):
+        for r, c, letter in cells:
+            self.assertTrue(game.make_move(r, c, letter))
+
+    def test_count_all_sos_does_not_wrap_rows(self):
+        game = GeneralSOSGame(board_size=4)
+        self.place_letters(game, [
+            (0, 2, "S"), (0, 3, "O"), (1, 0, "S"),  # Horizontal across a row end
+            (1, 3, "O"), (2, 2, "S"),               # Anti-diagonal from (1, 0) past column 0
+        ])
+        self.assertEqual(game.count_all_sos(), 0)
+
+    def test_count_all_sos_diagonals(self):
+        game = GeneralSOSGame(board_size=5)
+        self.place_letters(game, [
+            (0, 0, "S"), (1, 1, "O"), (2, 2, "S"),  # Diagonal
+            (0, 2, "S"), (2, 0, "S"),               # Anti-diagonal ending at column 0
+            (2, 4, "S"), (3, 3, "O"), (4, 2, "S"),  # Anti-diagonal from the last column
+        ])
+        self.assertEqual(game.count_all_sos(), 3)
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,81 @@
 # game_logic.py file: Core logic for the SOS game
-from typing import List, Optional
+from enum import IntEnum
+from functools import lru_cache
+from typing import Optional, Sequence
+
+# Cell encodings used by the byte boards: 0 always means empty
+_ENC = {"S": 1, "O": 2}
+_DEC = {0: None, 1: "S", 2: "O"}
+_OWNER_DEC = {0: None, 1: "blue", 2: "red"}
+_EMPTY_TUPLE = ()  # Shared "no SOS lines" result
+_VALID = frozenset(("S", "O"))  # Canonical letters accepted by make_move
+
+class Player(IntEnum):
+    """Player codes; also the owner codes stored in the owners array."""
+    BLUE = 1
+    RED = 2
+
+# Line directions checked for SOS: horizontal, vertical, two diagonals
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# ---------------- SOS Scan Kernel ----------------
+@lru_cache(maxsize=None)
+def _all_triples(n: int) -> tuple:
+    """
+    Every in-bounds 3-cell line of an n x n board as (i1, im, i2,
+    (r1, c1, r2, c2)): flat indices of the start, middle and end cells, plus
+    the line endpoints for drawing. Built once per board size.
+    """
+    triples = []
+    for r1 in range(n):
+        for c1 in range(n):
+            for dr, dc in DIRECTIONS:
+                r2, c2 = r1 + 2*dr, c1 + 2*dc
+                if 0 <= r2 < n > c2 >= 0:
+                    cells = [(r1 + k*dr) * n + c1 + k*dc for k in range(3)]
+                    triples.append((*cells, (r1, c1, r2, c2)))
+    return tuple(triples)
+
+@lru_cache(maxsize=None)
+def _cell_triples(n: int) -> tuple:
+    """
+    For every cell index r*n+c of an n x n board, the entries of
+    _all_triples(n) that pass through that cell.
+    """
+    triples = [[] for _ in range(n * n)]
+    for entry in _all_triples(n):
+        for i in entry[:3]:
+            triples[i].append(entry)
+    return tuple(tuple(t) for t in triples)
+
+def _scan_sos(letters, triples) -> Sequence[tuple]:
+    """
+    Return the (r1, c1, r2, c2) line of every triple in `triples` that
+    spells SOS in the flat `letters` buffer. Works on plain buffers only,
+    so it does not depend on a game object. When nothing matches (the
+    common case) the shared _EMPTY_TUPLE is returned instead of a new list.
+    """
+    sos_lines = None
+    for i1, im, i2, line in triples:
+        if letters[i1] == 1 and letters[im] == 2 and letters[i2] == 1:
+            if sos_lines is None:
+                sos_lines = []
+            sos_lines.append(line)
+    return sos_lines or _EMPTY_TUPLE
+
+def _encode_state(letters) -> int:
+    """Pack a flat letter buffer into one int: sum of letters[i] * 3**i."""
+    state = 0
+    for v in reversed(letters):
+        state = state * 3 + v
+    return state
+
+def _decode_state(state: int, n: int) -> bytearray:
+    """Unpack an int from _encode_state back into an n*n letter buffer."""
+    letters = bytearray(n * n)
+    for i in range(n * n):
+        state, letters[i] = divmod(state, 3)
+    return letters
 
 # ---------------- Base Class ----------------
 class BaseSOSGame:
@@ -15,78 +91,138 @@ class BaseSOSGame:
 
     def reset_game(self):
         """Reset the board and all game state variables."""
-        # 2D list representing the board cells; None = empty
-        self.board: List[List[Optional[str]]] = [
-            [None for _ in range(self.board_size)] for _ in range(self.board_size)
-        ]
-        self.current_turn = "blue"  # Starting player
+        n = self.board_size
+        # Board state as two parallel flat row-major byte arrays; 0 = empty
+        self.letters = bytearray(n * n)  # Letter in each cell (see _ENC)
+        self.owners = bytearray(n * n)   # Owner of each cell (a Player)
+        self.turn = Player.BLUE  # Starting player
         self.move_count = 0
         self.game_over = False
-        self.last_sos_lines = []  # Tracks SOS lines formed in last move
+        self.last_sos_lines = _EMPTY_TUPLE  # Tracks SOS lines formed in last move
         self.last_move_player = None  # Which player made the last move
-        # Owner of each cell ("blue" or "red") for coloring purposes
-        self.owner_board: List[List[Optional[str]]] = [
-            [None for _ in range(self.board_size)] for _ in range(self.board_size)
-        ]
+        # Bitboards for count_all_sos: bit r*(n+1)+c per cell; column n is an
+        # always-empty guard so shifted lines never wrap into the next row
+        self.S_bits = 0  # Cells holding S
+        self.O_bits = 0  # Cells holding O
+        self._total_cells = n * n
+        self._sos_triples = _cell_triples(n)
 
     def in_bounds(self, r, c):
-        """Check if row and column are inside the board boundaries."""
-        return 0 <= r < self.board_size and 0 <= c < self.board_size
+        """
+        Check if row and column are inside the board boundaries.
+        A single chained comparison (0 <= r < n > c >= 0) stands in for the
+        C-style unsigned compare; the SOS scan never calls this since its
+        triple table only holds in-bounds cells.
+        """
+        return 0 <= r < self.board_size > c >= 0
 
     def cell_empty(self, r, c):
         """Check if a cell is valid and currently empty."""
-        return self.in_bounds(r, c) and self.board[r][c] is None
+        return self.in_bounds(r, c) and self.letters[r * self.board_size + c] == 0
 
     def toggle_turn(self):
         """Switch turn from one player to the other."""
-        self.current_turn = "red" if self.current_turn == "blue" else "blue"
+        self.turn = Player(3 - self.turn)
+
+    @property
+    def current_turn(self) -> str:
+        """Whose turn it is as a string ('blue' or 'red')."""
+        return _OWNER_DEC[self.turn]
+
+    @current_turn.setter
+    def current_turn(self, player: str):
+        self.turn = Player[player.upper()]
 
     def get_cell(self, r, c):
         """Return the value of a cell ('S', 'O', or None) if in bounds."""
-        return None if not self.in_bounds(r, c) else self.board[r][c]
+        if not self.in_bounds(r, c):
+            return None
+        return _DEC[self.letters[r * self.board_size + c]]
 
     def get_cell_owner(self, r, c):
         """Return which player owns the cell ('blue', 'red', or None)."""
+        return _OWNER_DEC[self.get_cell_owner_code(r, c)]
+
+    def get_cell_owner_code(self, r, c) -> int:
+        """Return the owner of the cell as an int (0 = none, else a Player)."""
         if not self.in_bounds(r, c):
-            return None
-        return self.owner_board[r][c]
+            return 0
+        return self.owners[r * self.board_size + c]
 
-    def check_for_sos(self, r, c) -> List[tuple]:
+    def packed_cells(self) -> bytes:
         """
-        Check if placing a letter at (r, c) forms any SOS.
-        Returns a list of SOS lines represented as tuples (r1, c1, r2, c2).
-        Only checks in four directions (horizontal, vertical, two diagonals).
+        Return the board packed one byte per cell: letter in the low 2 bits,
+        owner in the next 2 bits. A 12x12 board fits in 144 bytes.
         """
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
-        sos_lines = []
+        return bytes(letter | (owner << 2) for letter, owner in zip(self.letters, self.owners))
 
-        for dr, dc in directions:
-            if self.form_sos(r, c, dr, dc):
-                sos_lines.append((r, c, r + 2*dr, c + 2*dc))
-            if self.form_sos(r, c, -dr, -dc):
-                sos_lines.append((r, c, r - 2*dr, c - 2*dc))
-        return sos_lines
+    def encode_state(self) -> int:
+        """
+        Return the letters on the board packed base-3 into a single int
+        (0 = empty, 1 = S, 2 = O per cell), usable as a dict/cache key.
+        """
+        return _encode_state(self.letters)
+
+    def decode_state(self, state: int) -> bytearray:
+        """Return the flat letter buffer for a state from encode_state()."""
+        return _decode_state(state, self.board_size)
 
-    def form_sos(self, r, c, dr, dc) -> bool:
+    def check_for_sos(self, r, c) -> Sequence[tuple]:
         """
-        Check if the 3-cell line starting at (r,c) in direction (dr,dc) is SOS.
-        Returns True if it forms SOS.
+        Check if placing a letter at (r, c) forms any SOS.
+        Returns a list of SOS lines represented as tuples (r1, c1, r2, c2),
+        or the shared empty tuple if there are none.
+        Checks the four directions (horizontal, vertical, two diagonals) with
+        (r, c) as either end or the middle of the SOS.
         """
-        if not (
-            self.in_bounds(r, c)
-            and self.in_bounds(r + dr, c + dc)
-            and self.in_bounds(r + 2*dr, c + 2*dc)
-        ):
-            return False
-        return (
-            self.board[r][c] == "S"
-            and self.board[r+dr][c+dc] == "O"
-            and self.board[r+2*dr][c+2*dc] == "S"
+        return _scan_sos(self.letters, self._sos_triples[r * self.board_size + c])
+
+    def count_all_sos(self) -> int:
+        """
+        Return the number of SOS lines anywhere on the board. For each
+        direction step, S & (O >> step) & (S >> 2*step) has a bit set at the
+        start of every SOS along it, so the count is a few shifts and ANDs.
+        """
+        w = self.board_size + 1
+        s_bits, o_bits = self.S_bits, self.O_bits
+        return sum(
+            (s_bits & (o_bits >> step) & (s_bits >> 2*step)).bit_count()
+            for step in (1, w, w + 1, w - 1)
         )
-    
+
+    def _place(self, r, c, letter: str):
+        """Record the current player's letter at (r, c) in every board form."""
+        n = self.board_size
+        i = r * n + c
+        self.letters[i] = _ENC[letter]
+        self.owners[i] = self.turn
+        bit = 1 << (r * (n + 1) + c)
+        if letter == "S":
+            self.S_bits |= bit
+        else:
+            self.O_bits |= bit
+        self.move_count += 1
+        self.last_move_player = self.current_turn
+
+    def make_move_untrusted(self, r, c, letter: str) -> bool:
+        """
+        make_move for callers that may pass letters like " s ";
+        make_move itself expects canonical "S"/"O" (as the GUI provides).
+        """
+        return self.make_move(r, c, letter.strip().upper())
+
     def is_board_full(self) -> bool:
-        """Return True if all cells are occupied."""
-        return self.move_count >= self.board_size * self.board_size
+        """Return True if all cells are occupied (O(1) via move_count)."""
+        return self.move_count >= self._total_cells
+
+    def post_move_result(self) -> dict:
+        """
+        Describe the game state for the UI after a move:
+        {'over': bool, 'message': Optional[str], 'score_text': str}
+        where message is the game-over text once the game has ended.
+        The base game never ends on its own and keeps no score.
+        """
+        return {"over": False, "message": None, "score_text": ""}
 
 # ---------------- Simple Game ----------------
 class SimpleSOSGame(BaseSOSGame):
@@ -98,20 +234,16 @@ class SimpleSOSGame(BaseSOSGame):
 
     def make_move(self, r, c, letter: str) -> bool:
         """
-        Attempt to place a letter at (r, c).
+        Attempt to place a letter ("S" or "O") at (r, c).
         Returns True if move was successful.
         Ends the game immediately if SOS is formed.
         """
         if self.game_over:
             return False
-        letter = letter.strip().upper()
-        if letter not in ("S", "O") or not self.cell_empty(r, c):
+        if letter not in _VALID or not self.cell_empty(r, c):
             return False
 
-        self.board[r][c] = letter
-        self.move_count += 1
-        self.owner_board[r][c] = self.current_turn
-        self.last_move_player = self.current_turn
+        self._place(r, c, letter)
 
         # Check for SOS
         sos_lines = self.check_for_sos(r, c)
@@ -125,6 +257,16 @@ class SimpleSOSGame(BaseSOSGame):
         self.toggle_turn()
         return True
 
+    def post_move_result(self) -> dict:
+        """Simple mode: over on the first SOS (winner) or a full board (draw)."""
+        if self.winner:
+            message = f"{self.winner.capitalize()} wins by forming SOS!"
+        elif self.is_board_full():
+            message = "It's a draw!"
+        else:
+            message = None
+        return {"over": message is not None, "message": message, "score_text": ""}
+
 # ---------------- General Game ----------------
 class GeneralSOSGame(BaseSOSGame):
     """General mode: score points for each SOS formed"""
@@ -135,20 +277,16 @@ class GeneralSOSGame(BaseSOSGame):
 
     def make_move(self, r, c, letter: str) -> bool:
         """
-        Attempt to place a letter at (r, c).
+        Attempt to place a letter ("S" or "O") at (r, c).
         Scores points for each SOS formed.
         The game ends when the board is full.
         """
         if self.game_over:
             return False
-        letter = letter.strip().upper()
-        if letter not in ("S", "O") or not self.cell_empty(r, c):
+        if letter not in _VALID or not self.cell_empty(r, c):
             return False
 
-        self.board[r][c] = letter
-        self.move_count += 1
-        self.owner_board[r][c] = self.current_turn
-        self.last_move_player = self.current_turn
+        self._place(r, c, letter)
 
         # Check for SOS and add to current player's score
         sos_lines = self.check_for_sos(r, c)
@@ -159,7 +297,24 @@ class GeneralSOSGame(BaseSOSGame):
         self.toggle_turn()  # Switch turns
 
         # End game if board is full
-        if self.move_count >= self.board_size * self.board_size:
+        if self.is_board_full():
             self.game_over = True
 
         return True
+
+    def post_move_result(self) -> dict:
+        """General mode: show scores; higher score wins once the board is full."""
+        blue, red = self.scores["blue"], self.scores["red"]
+        message = None
+        if self.game_over:
+            if blue > red:
+                message = "Blue wins with higher score!"
+            elif red > blue:
+                message = "Red wins with higher score!"
+            else:
+                message = "It's a draw!"
+        return {
+            "over": self.game_over,
+            "message": message,
+            "score_text": f"Blue: {blue} | Red: {red}",
+        }
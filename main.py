@@ -2,7 +2,10 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from game_logic import SimpleSOSGame, GeneralSOSGame  # Import game logic classes for two game modes
+from game_logic import SimpleSOSGame, GeneralSOSGame, Player  # Import game logic classes for two game modes
+
+# Cell text color indexed by owner code (0 = none, Player.BLUE, Player.RED)
+FG_COLOR = ("black", "blue", "red")
 
 class SOSApp:
     def __init__(self, root):
@@ -55,9 +58,10 @@ class SOSApp:
         self.score_label = ttk.Label(self.root, text="", font=("Arial",10,"bold"))
         self.score_label.grid(row=2, column=0, pady=(0,4))
 
-        # --- Frame to hold the game board buttons ---
+        # --- Frame to hold the game board cells ---
         self.board_frame = ttk.Frame(self.root, padding=8)
         self.board_frame.grid(row=3, column=0)
+        self._ui_size = None  # Board size the cell labels were built for
 
     def on_start_new_game(self):
         """
@@ -75,66 +79,92 @@ class SOSApp:
     def build_board_ui(self):
         """
         Build the board UI dynamically based on the game board size.
-        Initializes buttons for each cell and prepares canvas for drawing SOS lines.
+        Initializes a clickable label for each cell and prepares canvas for drawing SOS lines.
+        Restarting on the same size only resets the existing widgets.
         """
+        size = self.game.board_size
+        if self._ui_size == size:
+            self.reset_board_ui()
+            return
+
         # Clear previous board if exists
         for w in self.board_frame.winfo_children():
             w.destroy()
 
-        size = self.game.board_size
+        self._ui_size = size
         self.cell_size = 60
-        self.cell_buttons = [[None]*size for _ in range(size)]
+        # Pixel centers of each column/row for drawing SOS lines
+        self._cx = [c*self.cell_size + self.cell_size//2 for c in range(size)]
+        self._cy = [r*self.cell_size + self.cell_size//2 for r in range(size)]
+        self.cell_labels = [[None]*size for _ in range(size)]
 
         # Canvas for drawing SOS lines
         self.canvas = tk.Canvas(self.board_frame, width=size*self.cell_size,
                                 height=size*self.cell_size, bg="white", highlightthickness=0)
         self.canvas.grid(row=0, column=0, columnspan=size, rowspan=size)
 
-        # Create a button for each cell in the board
+        # Create a label for each cell in the board; lighter than a tk.Button
         for r in range(size):
             for c in range(size):
-                btn = tk.Button(self.board_frame, text="", width=4, height=2, font=("Arial",12,"bold"),
-                                command=lambda rr=r, cc=c: self.on_cell_clicked(rr,cc))
-                btn.grid(row=r, column=c, padx=2, pady=2)
-                self.cell_buttons[r][c] = btn
+                lbl = tk.Label(self.board_frame, text="", width=4, height=2, font=("Arial",12,"bold"),
+                               relief="raised", borderwidth=2)
+                lbl.grid(row=r, column=c, padx=2, pady=2)
+                # Bound once for the label's lifetime; disable_board gates clicks
+                lbl.bind("<Button-1>", lambda e, rr=r, cc=c: self.on_cell_clicked(rr, cc))
+                self.cell_labels[r][c] = lbl
+        self._board_enabled = True
 
         # Update initial labels
         self.update_turn_label()
         self.update_score_label()
 
+    def reset_board_ui(self):
+        """Clear the existing cell labels and SOS lines for a same-size restart."""
+        for row in self.cell_labels:
+            for lbl in row:
+                lbl.config(text="", fg="black")
+        self._board_enabled = True
+        self.canvas.delete("all")
+        self.update_turn_label()
+        self.update_score_label()
+
     def on_cell_clicked(self, r, c):
         """
         Handle a cell click: make a move, update UI, draw SOS lines, and handle endgame.
         """
-        if self.game.game_over:
+        if not self._board_enabled or self.game.game_over:
             return
 
         # Determine current player's selected letter
-        letter = self.red_letter_var.get() if self.game.current_turn == "red" else self.blue_letter_var.get()
+        letter = self.red_letter_var.get() if self.game.turn == Player.RED else self.blue_letter_var.get()
 
         # Attempt to make move in game logic; return if invalid
         if not self.game.make_move(r, c, letter):
             return
 
-        # Update UI after move
+        # Update UI after move, then handle game over scenarios
+        result = self._apply_ui_batch(r, c)
+        if result["over"]:
+            messagebox.showinfo("Game Over", result["message"])
+            self.disable_board()
+
+    def _apply_ui_batch(self, r, c):
+        """
+        Apply all widget changes for the move at (r, c) and flush them with a
+        single update_idletasks() so Tk redraws once (and before any dialog).
+        Returns the game's post_move_result().
+        """
+        result = self.game.post_move_result()
         self.update_cell_ui(r, c)
         self.update_turn_label()
-        self.update_score_label()
+        self.score_label.config(text=result["score_text"])
 
         # Draw any SOS lines formed
         if self.game.last_sos_lines:
             self.draw_sos_lines(self.game.last_sos_lines, self.game.last_move_player)
 
-        # Handle game over scenarios
-        if isinstance(self.game, SimpleSOSGame):
-            if self.game.winner:
-                messagebox.showinfo("Game Over", f"{self.game.winner.capitalize()} wins by forming SOS!")
-                self.disable_board()
-            elif self.game.is_board_full():  # <-- Draw check fixed
-                messagebox.showinfo("Game Over", "It's a draw!")
-                self.disable_board()
-        elif isinstance(self.game, GeneralSOSGame) and self.game.game_over:
-            self.show_general_result()
+        self.root.update_idletasks()
+        return result
 
     def draw_sos_lines(self, lines, player):
         """
@@ -143,27 +173,17 @@ class SOSApp:
         :param player: the player who formed the SOS
         """
         color = "blue" if player == "blue" else "red"
+        cx, cy = self._cx, self._cy
         for r1, c1, r2, c2 in lines:
-            x1 = c1*self.cell_size + self.cell_size//2
-            y1 = r1*self.cell_size + self.cell_size//2
-            x2 = c2*self.cell_size + self.cell_size//2
-            y2 = r2*self.cell_size + self.cell_size//2
-            self.canvas.create_line(x1, y1, x2, y2, fill=color, width=3)
+            self.canvas.create_line(cx[c1], cy[r1], cx[c2], cy[r2], fill=color, width=3)
 
     def update_cell_ui(self, r, c):
         """
         Update the text and color of a board cell based on game state.
         """
         val = self.game.get_cell(r, c)
-        btn = self.cell_buttons[r][c]
-        btn.config(text=val if val else "")
-        owner = self.game.get_cell_owner(r, c)
-        if owner == "red":
-            btn.config(fg="red")
-        elif owner == "blue":
-            btn.config(fg="blue")
-        else:
-            btn.config(fg="black")
+        lbl = self.cell_labels[r][c]
+        lbl.config(text=val if val else "", fg=FG_COLOR[self.game.get_cell_owner_code(r, c)])
 
     def update_turn_label(self):
         """Update the label showing whose turn it is."""
@@ -171,34 +191,11 @@ class SOSApp:
 
     def update_score_label(self):
         """Update the score label for General mode; empty for Simple mode."""
-        if isinstance(self.game, GeneralSOSGame):
-            self.score_label.config(text=f"Blue: {self.game.scores['blue']} | Red: {self.game.scores['red']}")
-        else:
-            self.score_label.config(text="")
-
-    def show_general_result(self):
-        """
-        Show game result for General mode when the board is full.
-        Determines winner or draw and disables the board.
-        """
-        blue, red = self.game.scores["blue"], self.game.scores["red"]
-        if blue > red:
-            winner = "Blue"
-        elif red > blue:
-            winner = "Red"
-        else:
-            winner = None
-        if winner:
-            messagebox.showinfo("Game Over", f"{winner} wins with higher score!")
-        else:
-            messagebox.showinfo("Game Over", "It's a draw!")
-        self.disable_board()
+        self.score_label.config(text=self.game.post_move_result()["score_text"])
 
     def disable_board(self):
-        """Disable all board buttons to prevent further moves."""
-        for row in self.cell_buttons:
-            for btn in row:
-                btn.config(state="disabled")
+        """Disable all board cells so clicks are ignored until the next game."""
+        self._board_enabled = False
 
 def main():
     """Main function to launch the SOS game app."""